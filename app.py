@@ -4,15 +4,27 @@ A lightweight Flask API for Raspberry Pi to perform ping checks and Wake-on-LAN
 """
 
 import os
-import re
+import hmac
 import sys
+import socket
 import logging
-import subprocess
-from functools import wraps
+import threading
+from functools import lru_cache
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from werkzeug.routing import BaseConverter
 from dotenv import load_dotenv
-from wakeonlan import send_magic_packet
+from icmplib import ping
+from cachetools import TTLCache
+
+try:
+    from orjson import dumps as json_dumps
+except ImportError:
+    # orjson is not installed on PyPy or armv6l (see requirements.txt)
+    import json
+
+    def json_dumps(data):
+        return json.dumps(data, separators=(',', ':')).encode()
 
 # =============================================================================
 # Configuration & Setup
@@ -43,57 +55,106 @@ if not API_KEY:
     logger.error("API_KEY not found in environment variables. Please configure .env file.")
     sys.exit(1)
 
+# Wake-on-LAN magic packets are broadcast to UDP port 9 on the local network
+WOL_BROADCAST_ADDRESS = ('255.255.255.255', 9)
+
+# Encoded once for constant-time comparison against the request header
+API_KEY_BYTES = API_KEY.encode()
+
 logger.info("PiNet API starting up...")
 
+# Broadcast UDP socket reused for every Wake-on-LAN request
+_wol_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+_wol_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+# Recent ping results (ip_address -> is_alive), so dashboards polling the same
+# hosts every few seconds do not trigger an ICMP round-trip on every request
+_ping_cache = TTLCache(maxsize=1024, ttl=3)
+_ping_cache_lock = threading.Lock()
+
+# =============================================================================
+# Responses
+# =============================================================================
+
+def json_response(data, status=200):
+    """
+    Build a JSON response serialized with orjson (stdlib json if unavailable).
+
+    Args:
+        data (dict): Response body
+        status (int): HTTP status code
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    return app.response_class(json_dumps(data), status=status, mimetype='application/json')
+
+# Health check payload never changes, so it is serialized once at import
+HEALTH_CHECK_BODY = json_dumps({
+    "service": "PiNet API",
+    "status": "running"
+})
+
 # =============================================================================
 # Authentication & Security
 # =============================================================================
 
-def require_api_key(f):
+# Endpoints that require a valid X-API-Key header. This is an allowlist:
+# routes not listed here are unauthenticated, so every new protected view
+# must be added to this set.
+PROTECTED_ENDPOINTS = frozenset({'ping_host', 'ping_invalid_ip', 'wake_on_lan'})
+
+# Authentication failure payloads, serialized once at import
+AUTH_MISSING_BODY = json_dumps({"status": "error", "message": "API key required"})
+AUTH_INVALID_BODY = json_dumps({"status": "error", "message": "Invalid API key"})
+
+@app.before_request
+def require_api_key():
     """
-    Decorator to require API key authentication for protected endpoints.
+    Require API key authentication for protected endpoints.
     Expects API key in 'X-API-Key' header.
+
+    Returns:
+        None to continue to the view, or a 401 JSON response
     """
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        provided_key = request.headers.get('X-API-Key')
+    # Flask's automatic OPTIONS responses are not authenticated
+    if request.method == 'OPTIONS' or request.endpoint not in PROTECTED_ENDPOINTS:
+        return None
 
-        if not provided_key:
-            logger.warning(f"Unauthorized access attempt from {request.remote_addr} - No API key provided")
-            return jsonify({"status": "error", "message": "API key required"}), 401
+    # Read the WSGI environ directly (X-API-Key header) to skip the
+    # case-insensitive EnvironHeaders lookup
+    provided_key = request.environ.get('HTTP_X_API_KEY')
 
-        if provided_key != API_KEY:
-            logger.warning(f"Unauthorized access attempt from {request.remote_addr} - Invalid API key")
-            return jsonify({"status": "error", "message": "Invalid API key"}), 401
+    if not provided_key:
+        logger.warning("Unauthorized access attempt from %s - No API key provided", request.remote_addr)
+        return app.response_class(AUTH_MISSING_BODY, status=401, mimetype='application/json')
 
-        return f(*args, **kwargs)
+    if not hmac.compare_digest(provided_key.encode(), API_KEY_BYTES):
+        logger.warning("Unauthorized access attempt from %s - Invalid API key", request.remote_addr)
+        return app.response_class(AUTH_INVALID_BODY, status=401, mimetype='application/json')
 
-    return decorated_function
+    return None
 
 # =============================================================================
 # Input Validation
 # =============================================================================
 
-def validate_ip_address(ip_address):
+class IPv4Converter(BaseConverter):
     """
-    Validate IPv4 address format to prevent command injection.
+    URL converter matching canonical dotted-quad IPv4 addresses
+    (0.0.0.0 to 255.255.255.255, no leading zeros).
 
-    Args:
-        ip_address (str): IP address string to validate
-
-    Returns:
-        bool: True if valid IPv4 format, False otherwise
+    Werkzeug compiles the pattern into the route regex once at startup, so
+    addresses are validated during routing rather than in the view. The low
+    weight makes it take precedence over the default string converter.
     """
-    # IPv4 regex pattern: matches 0.0.0.0 to 255.255.255.255
-    ipv4_pattern = re.compile(
-        r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}'
-        r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
+    regex = (
+        r'(?:(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)\.){3}'
+        r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
     )
+    weight = 50
 
-    if not ip_address or not isinstance(ip_address, str):
-        return False
-
-    return bool(ipv4_pattern.match(ip_address.strip()))
+app.url_map.converters['ipv4'] = IPv4Converter
 
 def validate_mac_address(mac_address):
     """
@@ -112,14 +173,37 @@ def validate_mac_address(mac_address):
     # Remove whitespace
     mac_address = mac_address.strip()
 
-    # MAC address patterns (colon, hyphen, or no separator)
-    mac_patterns = [
-        re.compile(r'^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$'),  # XX:XX:XX:XX:XX:XX
-        re.compile(r'^([0-9A-Fa-f]{2}-){5}[0-9A-Fa-f]{2}$'),  # XX-XX-XX-XX-XX-XX
-        re.compile(r'^[0-9A-Fa-f]{12}$')                       # XXXXXXXXXXXX
-    ]
+    # Separated forms must use one separator consistently between every octet
+    if len(mac_address) == 17:
+        separator = mac_address[2]
+        if separator not in ':-' or mac_address[2::3] != separator * 5:
+            return False
+        mac_address = mac_address.replace(separator, '')
+    elif len(mac_address) != 12:
+        return False
+
+    # Remaining 12 characters must be hex digits (6 octets)
+    try:
+        return len(bytes.fromhex(mac_address)) == 6
+    except ValueError:
+        return False
+
+# =============================================================================
+# Wake-on-LAN
+# =============================================================================
 
-    return any(pattern.match(mac_address) for pattern in mac_patterns)
+@lru_cache(maxsize=64)
+def build_magic_packet(mac_hex):
+    """
+    Build a Wake-on-LAN magic packet, memoized per MAC address.
+
+    Args:
+        mac_hex (str): Normalized MAC address (12 lowercase hex digits)
+
+    Returns:
+        bytes: 6 bytes of 0xFF followed by the MAC address repeated 16 times
+    """
+    return b'\xff' * 6 + bytes.fromhex(mac_hex) * 16
 
 # =============================================================================
 # API Endpoints
@@ -134,13 +218,9 @@ def health_check():
     Returns:
         JSON response with service status
     """
-    return jsonify({
-        "service": "PiNet API",
-        "status": "running"
-    }), 200
+    return app.response_class(HEALTH_CHECK_BODY, status=200, mimetype='application/json')
 
-@app.route('/ping/<ip_address>', methods=['GET'])
-@require_api_key
+@app.route('/ping/<ipv4:ip_address>', methods=['GET'])
 def ping_host(ip_address):
     """
     FR2: Ping Host
@@ -152,55 +232,61 @@ def ping_host(ip_address):
     Returns:
         JSON response with ping result (online/offline) or error
     """
-    # Validate IP address format
-    if not validate_ip_address(ip_address):
-        logger.warning(f"Invalid IP address format received: {ip_address}")
-        return jsonify({
-            "status": "error",
-            "message": "Invalid IP address format."
-        }), 400
+    # IP address format is validated by the ipv4 URL converter
+    with _ping_cache_lock:
+        is_alive = _ping_cache.get(ip_address)
 
     try:
-        # Execute ping command with single packet and timeout
-        # -c 1: Send only 1 packet
-        # -W 2: Wait maximum 2 seconds for response
-        result = subprocess.run(
-            ['ping', '-c', '1', '-W', '2', ip_address],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=5
-        )
-
-        # Check return code (0 = success/online, non-zero = failure/offline)
-        if result.returncode == 0:
-            logger.info(f"Ping successful: {ip_address} is online")
-            return jsonify({
+        if is_alive is None:
+            # Send a single ICMP echo request over an unprivileged datagram
+            # socket (no ping process is spawned); wait maximum 2 seconds.
+            # The kernel ARP table is deliberately not consulted: its
+            # "complete" flag also covers STALE entries, which can outlive a
+            # host going to sleep indefinitely on a small LAN.
+            host = ping(ip_address, count=1, timeout=2, privileged=False)
+            is_alive = host.is_alive
+
+            with _ping_cache_lock:
+                _ping_cache[ip_address] = is_alive
+
+        if is_alive:
+            logger.info("Ping successful: %s is online", ip_address)
+            return json_response({
                 "ip_address": ip_address,
                 "status": "online"
-            }), 200
+            }, 200)
         else:
-            logger.info(f"Ping failed: {ip_address} is offline")
-            return jsonify({
+            logger.info("Ping failed: %s is offline", ip_address)
+            return json_response({
                 "ip_address": ip_address,
                 "status": "offline"
-            }), 200
-
-    except subprocess.TimeoutExpired:
-        logger.info(f"Ping timeout: {ip_address} is offline")
-        return jsonify({
-            "ip_address": ip_address,
-            "status": "offline"
-        }), 200
+            }, 200)
 
     except Exception as e:
-        logger.error(f"Error pinging {ip_address}: {str(e)}")
-        return jsonify({
+        logger.error("Error pinging %s: %s", ip_address, e)
+        return json_response({
             "status": "error",
             "message": "Internal error executing ping"
-        }), 500
+        }, 500)
+
+@app.route('/ping/<ip_address>', methods=['GET'])
+def ping_invalid_ip(ip_address):
+    """
+    Reject /ping requests whose address did not match the ipv4 converter.
+
+    Args:
+        ip_address (str): Rejected IP address string
+
+    Returns:
+        JSON error response (400)
+    """
+    logger.warning("Invalid IP address format received: %s", ip_address)
+    return json_response({
+        "status": "error",
+        "message": "Invalid IP address format."
+    }, 400)
 
 @app.route('/wol', methods=['POST'])
-@require_api_key
 def wake_on_lan():
     """
     FR3: Wake-on-LAN
@@ -211,49 +297,51 @@ def wake_on_lan():
     Returns:
         JSON response with success or error message
     """
-    # Parse JSON request body
-    data = request.get_json()
+    # Parse JSON request body; silent=True returns None for a missing or
+    # malformed body (or wrong Content-Type) instead of raising
+    data = request.get_json(silent=True)
 
-    if not data:
+    if not data or not isinstance(data, dict):
         logger.warning("WoL request received with no JSON body")
-        return jsonify({
+        return json_response({
             "status": "error",
             "message": "Request body must be JSON"
-        }), 400
+        }, 400)
 
     mac_address = data.get('mac_address')
 
     if not mac_address:
         logger.warning("WoL request received without mac_address field")
-        return jsonify({
+        return json_response({
             "status": "error",
             "message": "Missing mac_address field in request body"
-        }), 400
+        }, 400)
 
     # Validate MAC address format
     if not validate_mac_address(mac_address):
-        logger.warning(f"Invalid MAC address format received: {mac_address}")
-        return jsonify({
+        logger.warning("Invalid MAC address format received: %s", mac_address)
+        return json_response({
             "status": "error",
             "message": "Invalid MAC address format."
-        }), 400
+        }, 400)
 
     try:
         # Send Wake-on-LAN magic packet
-        send_magic_packet(mac_address)
-        logger.info(f"Wake-on-LAN packet sent successfully to {mac_address}")
+        mac_hex = mac_address.strip().replace(':', '').replace('-', '').lower()
+        _wol_sock.sendto(build_magic_packet(mac_hex), WOL_BROADCAST_ADDRESS)
+        logger.info("Wake-on-LAN packet sent successfully to %s", mac_address)
 
-        return jsonify({
+        return json_response({
             "status": "success",
             "message": f"Wake-on-LAN packet sent to {mac_address}"
-        }), 200
+        }, 200)
 
     except Exception as e:
-        logger.error(f"Error sending WoL packet to {mac_address}: {str(e)}")
-        return jsonify({
+        logger.error("Error sending WoL packet to %s: %s", mac_address, e)
+        return json_response({
             "status": "error",
             "message": "Failed to send Wake-on-LAN packet"
-        }), 500
+        }, 500)
 
 # =============================================================================
 # Error Handlers
@@ -262,29 +350,29 @@ def wake_on_lan():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 Not Found errors"""
-    logger.warning(f"404 Not Found: {request.url}")
-    return jsonify({
+    logger.warning("404 Not Found: %s", request.url)
+    return json_response({
         "status": "error",
         "message": "Endpoint not found"
-    }), 404
+    }, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 Internal Server Error"""
-    logger.error(f"500 Internal Server Error: {str(error)}")
-    return jsonify({
+    logger.error("500 Internal Server Error: %s", error)
+    return json_response({
         "status": "error",
         "message": "Internal server error"
-    }), 500
+    }, 500)
 
 @app.errorhandler(Exception)
 def handle_exception(error):
     """Handle uncaught exceptions"""
-    logger.error(f"Unhandled exception: {str(error)}", exc_info=True)
-    return jsonify({
+    logger.error("Unhandled exception: %s", error, exc_info=True)
+    return json_response({
         "status": "error",
         "message": "An unexpected error occurred"
-    }), 500
+    }, 500)
 
 # =============================================================================
 # Application Entry Point
@@ -292,10 +380,17 @@ def handle_exception(error):
 
 if __name__ == '__main__':
     # Development server configuration
-    # Note: In production, this app will be run via Gunicorn (see systemd service)
-    logger.info(f"Starting development server on 0.0.0.0:{API_PORT}")
+    # Note: In production, this app is run via Gunicorn (wsgi.py, see systemd
+    # service). The Werkzeug server is single-threaded, so it is only started
+    # when explicitly requested with FLASK_DEV=1.
+    if os.getenv('FLASK_DEV') != '1':
+        logger.error("Development server disabled. Set FLASK_DEV=1 to run it, "
+                     "or use: gunicorn -k gevent wsgi:application")
+        sys.exit(1)
+
+    logger.info("Starting development server on 0.0.0.0:%s", API_PORT)
     app.run(
         host='0.0.0.0',  # Listen on all network interfaces
         port=API_PORT,
         debug=False       # Disable debug mode for security
-    )
\ No newline at end of file
+    )
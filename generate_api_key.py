@@ -6,6 +6,7 @@ Generates a secure random API key and updates the .env file
 """
 
 import os
+import re
 import secrets
 import string
 import sys
@@ -68,29 +69,26 @@ def update_env_file(env_path: str, api_key: str) -> bool:
             print_info("  cp .env.example .env")
             return False
 
-        with open(env_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        # Find and update the API_KEY line
-        updated = False
-        new_lines = []
-
-        for line in lines:
-            if line.strip().startswith('API_KEY='):
-                # Replace the API_KEY line
-                new_lines.append(f'API_KEY={api_key}\n')
-                updated = True
-            else:
-                new_lines.append(line)
-
-        if not updated:
-            print_error("API_KEY line not found in .env file")
-            print_info("Please ensure your .env file has an API_KEY= line")
-            return False
-
-        # Write the updated content back
-        with open(env_path, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+        with open(env_path, 'r+', encoding='utf-8') as f:
+            content = f.read()
+
+            # Replace the API_KEY line in a single pass over the file content
+            new_content, count = re.subn(
+                r'^[ \t]*API_KEY=.*$',
+                lambda _: f'API_KEY={api_key}',
+                content,
+                flags=re.MULTILINE
+            )
+
+            if count == 0:
+                print_error("API_KEY line not found in .env file")
+                print_info("Please ensure your .env file has an API_KEY= line")
+                return False
+
+            # Write the updated content back
+            f.seek(0)
+            f.truncate()
+            f.write(new_content)
 
         return True
 
@@ -166,6 +166,34 @@ chmod 600 "$APP_DIR/.env"
 chown "$APP_USER:$APP_USER" "$APP_DIR/.env"
 print_success "Permissions set on .env file"
 
+# Allow unprivileged ICMP sockets so the service can ping without root.
+# The range is host-wide (systemd defaults it to "0 2147483647"), so it is
+# only widened when the service user's group falls outside it.
+print_info "Checking unprivileged ICMP (ping) socket access..."
+APP_GID=$(id -g "$APP_USER")
+read -r PING_GID_LOW PING_GID_HIGH <<< "$(sysctl -n net.ipv4.ping_group_range)"
+
+if [ "$APP_GID" -ge "$PING_GID_LOW" ] && [ "$APP_GID" -le "$PING_GID_HIGH" ]; then
+    print_success "Unprivileged ICMP sockets already allowed for GID $APP_GID"
+else
+    if [ "$PING_GID_LOW" -gt "$PING_GID_HIGH" ]; then
+        # Empty range (kernel default "1 0"): allow only the service group
+        PING_GID_LOW=$APP_GID
+        PING_GID_HIGH=$APP_GID
+    elif [ "$APP_GID" -lt "$PING_GID_LOW" ]; then
+        PING_GID_LOW=$APP_GID
+    else
+        PING_GID_HIGH=$APP_GID
+    fi
+
+    echo "net.ipv4.ping_group_range = $PING_GID_LOW $PING_GID_HIGH" > /etc/sysctl.d/99-pinet-api.conf
+    sysctl -q -p /etc/sysctl.d/99-pinet-api.conf || {
+        print_error "Failed to set net.ipv4.ping_group_range"
+        exit 1
+    }
+    print_success "Unprivileged ICMP sockets enabled (range $PING_GID_LOW-$PING_GID_HIGH)"
+fi
+
 ################################################################################
 # Systemd Service Setup
 ################################################################################
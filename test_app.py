@@ -7,8 +7,10 @@ Tests all API endpoints from a remote machine
 
 import sys
 import json
+import threading
 import requests
-from typing import Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Tuple
 
 # ANSI color codes for formatted output
 class Colors:
@@ -20,6 +22,17 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Per-thread output buffer so concurrently running tests do not interleave
+_output = threading.local()
+
+def emit(text: str = "") -> None:
+    """Print text, or buffer it when running inside a concurrent test"""
+    lines = getattr(_output, 'lines', None)
+    if lines is None:
+        print(text)
+    else:
+        lines.append(text)
+
 def print_header(text: str) -> None:
     """Print a formatted section header"""
     print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 70}{Colors.END}")
@@ -28,23 +41,23 @@ def print_header(text: str) -> None:
 
 def print_test(test_name: str) -> None:
     """Print a test name"""
-    print(f"{Colors.BOLD}{Colors.BLUE}TEST: {test_name}{Colors.END}")
+    emit(f"{Colors.BOLD}{Colors.BLUE}TEST: {test_name}{Colors.END}")
 
 def print_success(message: str) -> None:
     """Print a success message"""
-    print(f"{Colors.GREEN}✓ {message}{Colors.END}")
+    emit(f"{Colors.GREEN}✓ {message}{Colors.END}")
 
 def print_error(message: str) -> None:
     """Print an error message"""
-    print(f"{Colors.RED}✗ {message}{Colors.END}")
+    emit(f"{Colors.RED}✗ {message}{Colors.END}")
 
 def print_warning(message: str) -> None:
     """Print a warning message"""
-    print(f"{Colors.YELLOW}⚠ {message}{Colors.END}")
+    emit(f"{Colors.YELLOW}⚠ {message}{Colors.END}")
 
 def print_info(message: str) -> None:
     """Print an info message"""
-    print(f"{Colors.CYAN}➜ {message}{Colors.END}")
+    emit(f"{Colors.CYAN}➜ {message}{Colors.END}")
 
 def format_json(data: Dict[str, Any]) -> str:
     """Format JSON data with indentation"""
@@ -89,11 +102,12 @@ def get_user_input() -> Tuple[str, str, str, str]:
 
     return base_url, api_key, test_ip, test_mac
 
-def test_health_check(base_url: str) -> bool:
+def test_health_check(session: requests.Session, base_url: str) -> bool:
     """
     Test FR1: Health Check endpoint
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
 
     Returns:
@@ -102,7 +116,7 @@ def test_health_check(base_url: str) -> bool:
     print_test("FR1: Health Check (GET /)")
 
     try:
-        response = requests.get(f"{base_url}/", timeout=10)
+        response = session.get(f"{base_url}/", timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -129,13 +143,13 @@ def test_health_check(base_url: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
-def test_ping_host(base_url: str, api_key: str, target_ip: str) -> bool:
+def test_ping_host(session: requests.Session, base_url: str, target_ip: str) -> bool:
     """
     Test FR2: Ping Host endpoint
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
-        api_key: API key for authentication
         target_ip: IP address to ping
 
     Returns:
@@ -143,12 +157,8 @@ def test_ping_host(base_url: str, api_key: str, target_ip: str) -> bool:
     """
     print_test(f"FR2: Ping Host (GET /ping/{target_ip})")
 
-    headers = {
-        'X-API-Key': api_key
-    }
-
     try:
-        response = requests.get(f"{base_url}/ping/{target_ip}", headers=headers, timeout=10)
+        response = session.get(f"{base_url}/ping/{target_ip}", timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -175,13 +185,13 @@ def test_ping_host(base_url: str, api_key: str, target_ip: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
-def test_wake_on_lan(base_url: str, api_key: str, target_mac: str) -> bool:
+def test_wake_on_lan(session: requests.Session, base_url: str, target_mac: str) -> bool:
     """
     Test FR3: Wake-on-LAN endpoint
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
-        api_key: API key for authentication
         target_mac: MAC address to send WoL packet to
 
     Returns:
@@ -189,17 +199,13 @@ def test_wake_on_lan(base_url: str, api_key: str, target_mac: str) -> bool:
     """
     print_test(f"FR3: Wake-on-LAN (POST /wol)")
 
-    headers = {
-        'X-API-Key': api_key,
-        'Content-Type': 'application/json'
-    }
-
     payload = {
         'mac_address': target_mac
     }
 
     try:
-        response = requests.post(f"{base_url}/wol", headers=headers, json=payload, timeout=10)
+        # json= sets the Content-Type: application/json header
+        response = session.post(f"{base_url}/wol", json=payload, timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -226,27 +232,23 @@ def test_wake_on_lan(base_url: str, api_key: str, target_mac: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
-def test_invalid_ip(base_url: str, api_key: str) -> bool:
+def test_invalid_ip(session: requests.Session, base_url: str) -> bool:
     """
     Test error handling for invalid IP address
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
-        api_key: API key for authentication
 
     Returns:
         True if test passed, False otherwise
     """
     print_test("Error Handling: Invalid IP Address")
 
-    headers = {
-        'X-API-Key': api_key
-    }
-
     invalid_ip = "999.999.999.999"
 
     try:
-        response = requests.get(f"{base_url}/ping/{invalid_ip}", headers=headers, timeout=10)
+        response = session.get(f"{base_url}/ping/{invalid_ip}", timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -273,11 +275,12 @@ def test_invalid_ip(base_url: str, api_key: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
-def test_missing_api_key(base_url: str, target_ip: str) -> bool:
+def test_missing_api_key(session: requests.Session, base_url: str, target_ip: str) -> bool:
     """
     Test authentication with missing API key
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
         target_ip: IP address to ping
 
@@ -287,7 +290,8 @@ def test_missing_api_key(base_url: str, target_ip: str) -> bool:
     print_test("Security: Missing API Key")
 
     try:
-        response = requests.get(f"{base_url}/ping/{target_ip}", timeout=10)
+        # A None value drops the session's X-API-Key header for this request
+        response = session.get(f"{base_url}/ping/{target_ip}", headers={'X-API-Key': None}, timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -310,11 +314,12 @@ def test_missing_api_key(base_url: str, target_ip: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
-def test_wrong_api_key(base_url: str, target_ip: str) -> bool:
+def test_wrong_api_key(session: requests.Session, base_url: str, target_ip: str) -> bool:
     """
     Test authentication with wrong API key
 
     Args:
+        session: HTTP session carrying the API key header
         base_url: Base URL of the API
         target_ip: IP address to ping
 
@@ -328,7 +333,7 @@ def test_wrong_api_key(base_url: str, target_ip: str) -> bool:
     }
 
     try:
-        response = requests.get(f"{base_url}/ping/{target_ip}", headers=headers, timeout=10)
+        response = session.get(f"{base_url}/ping/{target_ip}", headers=headers, timeout=10)
 
         print_info(f"Status Code: {response.status_code}")
 
@@ -351,38 +356,74 @@ def test_wrong_api_key(base_url: str, target_ip: str) -> bool:
         print_error(f"Request failed: {str(e)}")
         return False
 
+def run_buffered(test_func: Callable[..., bool], headers: Dict[str, str], *args: Any) -> Tuple[bool, List[str]]:
+    """
+    Run a test function with its output captured
+
+    Each call gets its own requests.Session (Session is not guaranteed to be
+    thread-safe). Unexpected exceptions are reported as a failed test.
+
+    Args:
+        test_func: Test function to run (receives the session first)
+        headers: Default headers for the session
+        *args: Remaining arguments passed to the test function
+
+    Returns:
+        Tuple of (test result, captured output lines)
+    """
+    _output.lines = []
+    try:
+        with requests.Session() as session:
+            session.headers.update(headers)
+            result = test_func(session, *args)
+    except Exception as e:
+        print_error(f"Unexpected error: {str(e)}")
+        result = False
+    finally:
+        lines = _output.lines
+        _output.lines = None
+
+    return result, lines
+
 def main():
     """Main test execution"""
 
     # Get user input
     base_url, api_key, test_ip, test_mac = get_user_input()
 
-    # Track test results
-    results = []
+    # Default headers for each test's session
+    headers = {'X-API-Key': api_key}
+
+    # (name, test function, arguments after the session); the endpoints are
+    # independent, so the tests run concurrently and their buffered output is
+    # printed in order
+    tests: List[Tuple[str, Callable[..., bool], tuple]] = [
+        # Functional tests
+        ("Health Check", test_health_check, (base_url,)),
+        ("Ping Host", test_ping_host, (base_url, test_ip)),
+        ("Wake-on-LAN", test_wake_on_lan, (base_url, test_mac)),
+        # Error handling tests
+        ("Invalid IP", test_invalid_ip, (base_url,)),
+        # Security tests
+        ("Missing API Key", test_missing_api_key, (base_url, test_ip)),
+        ("Wrong API Key", test_wrong_api_key, (base_url, test_ip)),
+    ]
 
     # Run tests
     print_header("Running API Tests")
 
-    # Functional tests
-    results.append(("Health Check", test_health_check(base_url)))
-    print()
-
-    results.append(("Ping Host", test_ping_host(base_url, api_key, test_ip)))
-    print()
-
-    results.append(("Wake-on-LAN", test_wake_on_lan(base_url, api_key, test_mac)))
-    print()
-
-    # Error handling tests
-    results.append(("Invalid IP", test_invalid_ip(base_url, api_key)))
-    print()
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(run_buffered, func, headers, *args) for _, func, args in tests]
 
-    # Security tests
-    results.append(("Missing API Key", test_missing_api_key(base_url, test_ip)))
-    print()
+    # Track test results
+    results = []
 
-    results.append(("Wrong API Key", test_wrong_api_key(base_url, test_ip)))
-    print()
+    for (test_name, _, _), future in zip(tests, futures):
+        result, lines = future.result()
+        for line in lines:
+            print(line)
+        print()
+        results.append((test_name, result))
 
     # Print summary
     print_header("Test Summary")
@@ -0,0 +1,13 @@
+"""
+PiNet API - WSGI Entry Point
+Exposes the Flask application for Gunicorn (see systemd service)
+"""
+
+# Patch blocking stdlib I/O (socket, select) before the app is imported so
+# ICMP pings and WoL sends yield to other greenlets under gevent workers
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402
+
+application = app